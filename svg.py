@@ -1,27 +1,42 @@
 #!/usr/bin/env python3
 import argparse
-import math
+import glob
+import io
 import os
 import re
 import sys
-import tempfile
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 import numpy as np
 from PIL import Image, ImageFilter
 
+import xml.etree.ElementTree as StdET
+
 import vtracer
 
+try:
+    from lxml import etree as ET   # C tree with O(1) getparent()
+    # Drop comments/PIs like the stdlib parser does, so both backends emit the same tree.
+    XML_PARSER = ET.XMLParser(remove_comments=True, remove_pis=True)
+except ImportError:
+    ET = StdET
+    XML_PARSER = None
+
 RGB_RE = re.compile(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", re.I)
+STYLE_DECL_RE = re.compile(r"\s*([^:;]+?)\s*:\s*([^;]*)")
 
+@lru_cache(maxsize=64)
 def parse_hex6(s: str):
     s = s.strip().lower()
     if s.startswith("#"):
         s = s[1:]
     if len(s) != 6:
         raise ValueError("Expected 6-digit hex like FF00FF")
-    return (int(s[0:2], 16), int(s[2:4], 16), int(s[4:6], 16))
+    return tuple(bytes.fromhex(s))
 
+# VTracer reuses one fill string per traced color, so nearly every lookup is a cache hit
+@lru_cache(maxsize=1024)
 def color_to_rgb(v: str):
     if not v:
         return None
@@ -29,126 +44,233 @@ def color_to_rgb(v: str):
     if v == "none":
         return None
     if v.startswith("#") and len(v) == 7:
-        return (int(v[1:3], 16), int(v[3:5], 16), int(v[5:7], 16))
+        return tuple(bytes.fromhex(v[1:]))
     m = RGB_RE.fullmatch(v)
     if m:
         return tuple(int(x) for x in m.groups())
     return None
 
-def rgb_dist(a, b):
-    return math.sqrt((a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2)
+def rgb_dist2(a, b):
+    """Squared RGB distance; compare against tol*tol instead of taking a sqrt."""
+    return (a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2
 
-def style_get(style: str, key: str):
-    if not style:
-        return None
-    for part in style.split(";"):
-        if ":" not in part:
-            continue
-        k, v = part.split(":", 1)
-        if k.strip().lower() == key.lower():
-            return v.strip()
-    return None
+# Sibling elements frequently share an identical style string
+@lru_cache(maxsize=64)
+def _style_decls(style: str):
+    return tuple((k.lower(), v.strip()) for k, v in STYLE_DECL_RE.findall(style))
 
-def style_set(style: str, key: str, value: str):
-    style = style or ""
-    parts = []
-    found = False
-    for part in [p.strip() for p in style.split(";") if p.strip()]:
-        if ":" not in part:
-            parts.append(part)
-            continue
-        k, v = part.split(":", 1)
-        if k.strip().lower() == key.lower():
-            parts.append(f"{k.strip()}:{value}")
-            found = True
+def parse_style(style: str):
+    """Parse an inline style into {lowercased-key: value}, preserving declaration order."""
+    if not style or ":" not in style:
+        return {}
+    # Fresh dict per call: callers may edit it before re-emitting with format_style
+    return dict(_style_decls(style))
+
+def format_style(decls):
+    return ";".join(f"{k}:{v}" for k, v in decls.items())
+
+def _strip_bg_stroke_or_drop(el, bg_rgb, tol2: int):
+    """
+    Decide one element: returns "drop" for a pure background element, "stripped"
+    after replacing a bg-colored stroke with none in place, else None.
+    """
+    fill_v = el.get("fill")
+    stroke_v = el.get("stroke")
+    # Attributes win; only parse the inline style (once, for both lookups) if one is missing
+    decls = parse_style(el.get("style")) if not (fill_v and stroke_v) else {}
+    fill_v = fill_v or decls.get("fill")
+    stroke_v = stroke_v or decls.get("stroke")
+
+    fill_rgb = color_to_rgb(fill_v) if fill_v else None
+    stroke_rgb = color_to_rgb(stroke_v) if stroke_v else None
+
+    fill_is_bg = fill_rgb and rgb_dist2(fill_rgb, bg_rgb) <= tol2
+    stroke_is_bg = stroke_rgb and rgb_dist2(stroke_rgb, bg_rgb) <= tol2
+
+    # Remove pure background elements
+    if fill_is_bg and (not stroke_rgb or stroke_is_bg):
+        return "drop"
+
+    # Strip bg-colored strokes (should be rare now)
+    if stroke_is_bg:
+        if "stroke" in el.attrib:
+            el.set("stroke", "none")
         else:
-            parts.append(f"{k.strip()}:{v.strip()}")
-    if not found:
-        parts.append(f"{key}:{value}")
-    return ";".join(parts)
+            decls["stroke"] = "none"
+            el.set("style", format_style(decls))
+        return "stripped"
+
+    return None
+
+def _parse_svg(svg_bytes: bytes):
+    """Parse with lxml when available; returns (root, ElementTree module that built it)."""
+    if XML_PARSER is not None:
+        try:
+            return ET.fromstring(svg_bytes, XML_PARSER), ET
+        except ET.XMLSyntaxError:
+            # libxml2 caps a single attribute value at 10MB, which a large trace's "d" can
+            # exceed. Retry with the stdlib parser, which has no such cap, rather than lift
+            # libxml2's limits (huge_tree) for every document.
+            pass
+    return StdET.fromstring(svg_bytes), StdET
 
 def remove_key_color_from_svg(svg_text: str, bg_rgb, tol: float):
     """
     Remove key-colored background shapes and key-colored stroke halos.
     With hard mask + forced palette, tol can stay low (e.g. 3-8).
+    Returns (utf-8 svg bytes, removed count, stripped count).
     """
-    root = ET.fromstring(svg_text)
-    parent = {c: p for p in root.iter() for c in p}
-
-    removed = 0
-    strokestripped = 0
-
-    for el in list(root.iter()):
-        style = el.get("style", "")
-
-        fill_v = el.get("fill") or style_get(style, "fill")
-        stroke_v = el.get("stroke") or style_get(style, "stroke")
+    # Squared distances are ints, so d2 <= tol*tol  <=>  d2 <= floor(tol*tol): integer compares only.
+    # A negative tol matches nothing (dist <= tol never holds); squaring it would not.
+    tol2 = int(tol * tol) if tol >= 0 else -1
 
-        fill_rgb = color_to_rgb(fill_v) if fill_v else None
-        stroke_rgb = color_to_rgb(stroke_v) if stroke_v else None
+    # lxml rejects str input that carries an encoding declaration, so always parse bytes
+    if isinstance(svg_text, str):
+        svg_text = svg_text.encode("utf-8")
+    root, tree = _parse_svg(svg_text)
 
-        fill_is_bg = fill_rgb and rgb_dist(fill_rgb, bg_rgb) <= tol
-        stroke_is_bg = stroke_rgb and rgb_dist(stroke_rgb, bg_rgb) <= tol
-
-        # Remove pure background elements
-        if fill_is_bg and (not stroke_rgb or stroke_is_bg):
-            p = parent.get(el)
-            if p is not None:
+    removed = 0
+    # The root itself is never removed, but may still have its stroke stripped
+    strokestripped = int(_strip_bg_stroke_or_drop(root, bg_rgb, tol2) == "stripped")
+
+    # Walk with each parent in hand so no parent map is needed. Dropped subtrees are not
+    # descended into. For VTracer's flat <svg><path/>...</svg> this is one tight loop.
+    stack = [root]
+    while stack:
+        p = stack.pop()
+        for el in list(p):
+            verdict = _strip_bg_stroke_or_drop(el, bg_rgb, tol2)
+            if verdict == "drop":
                 p.remove(el)
                 removed += 1
-            continue
-
-        # Strip bg-colored strokes (should be rare now)
-        if stroke_is_bg:
-            if "stroke" in el.attrib:
-                el.set("stroke", "none")
-            else:
-                el.set("style", style_set(style, "stroke", "none"))
-            strokestripped += 1
+                continue
+            if verdict == "stripped":
+                strokestripped += 1
+            stack.append(el)
+
+    return tree.tostring(root, encoding="utf-8"), removed, strokestripped
+
+def _key_mask_np(arr, bg_rgb, alpha_cutoff: int, bg_dist: int):
+    # Work channel by channel on the uint8 planes so no HxWx3 int32 copy is ever made;
+    # only the HxW accumulator is widened (int32 avoids overflow).
+    dist2 = np.zeros(arr.shape[:2], dtype=np.int32)
+    for c in range(3):
+        d = np.subtract(arr[..., c], int(bg_rgb[c]), dtype=np.int32)
+        dist2 += np.multiply(d, d, out=d)
+    fg = dist2 > bg_dist*bg_dist
+    if arr.shape[2] == 4:
+        fg &= arr[..., 3] > alpha_cutoff
+    elif alpha_cutoff >= 255:   # RGB input reads as alpha 255 everywhere
+        fg[:] = False
+    return fg
+
+def _snap_to_palette_np(arr, fg, coef, thresh: int):
+    proj = np.zeros(arr.shape[:2], dtype=np.int32)
+    for c in range(3):
+        proj += np.multiply(arr[..., c], int(coef[c]), dtype=np.int32)
+    return np.where(fg, np.where(proj < thresh, 2, 1), 0).astype(np.uint8)
+
+# numba costs ~0.3s per process to import and load its JIT cache, and its kernels save
+# ~10ns/pixel over the NumPy ones, so it only pays off on very large (upscaled) images
+NUMBA_MIN_PIXELS = 32_000_000
+
+@lru_cache(maxsize=None)
+def _jit_kernels():
+    """The numba (key_mask, snap_to_palette) kernels, or None when numba isn't installed."""
+    try:
+        from numba import njit, prange
+    except ImportError:  # optional; the NumPy kernels above are used instead
+        return None
 
-    return ET.tostring(root, encoding="unicode"), removed, strokestripped
+    @njit(parallel=True, cache=True)
+    def key_mask(arr, bg_rgb, alpha_cutoff, bg_dist):
+        h, w = arr.shape[0], arr.shape[1]
+        has_alpha = arr.shape[2] == 4
+        rgb_opaque = 255 > alpha_cutoff   # RGB input reads as alpha 255 everywhere
+        bg_d2 = bg_dist*bg_dist
+        fg = np.empty((h, w), dtype=np.bool_)
+        for y in prange(h):
+            for x in range(w):
+                dr = np.int64(arr[y, x, 0]) - bg_rgb[0]
+                dg = np.int64(arr[y, x, 1]) - bg_rgb[1]
+                db = np.int64(arr[y, x, 2]) - bg_rgb[2]
+                opaque = arr[y, x, 3] > alpha_cutoff if has_alpha else rgb_opaque
+                fg[y, x] = opaque and dr*dr + dg*dg + db*db > bg_d2
+        return fg
+
+    @njit(parallel=True, cache=True)
+    def snap_to_palette(arr, fg, coef, thresh):
+        h, w = arr.shape[0], arr.shape[1]
+        idx = np.empty((h, w), dtype=np.uint8)
+        for y in prange(h):
+            for x in range(w):
+                k = 0
+                if fg[y, x]:
+                    proj = (np.int64(arr[y, x, 0])*coef[0] + np.int64(arr[y, x, 1])*coef[1]
+                            + np.int64(arr[y, x, 2])*coef[2])
+                    k = 2 if proj < thresh else 1
+                idx[y, x] = k
+        return idx
+
+    return key_mask, snap_to_palette
+
+# scipy.ndimage costs ~0.12s to import; its separable close saves ~150ns/pixel over
+# Pillow's at --morph 5, so it is only loaded once the mask is this large
+SCIPY_MIN_PIXELS = 1_000_000
+
+@lru_cache(maxsize=None)
+def _ndimage():
+    try:
+        from scipy import ndimage
+    except ImportError:  # optional; Pillow's rank filters are used instead
+        return None
+    return ndimage
 
 def preprocess_flat_keyed_rgb(
     in_png: str,
-    out_png_rgb: str,
     *,
     white_rgb,
     blue_rgb,
     bg_rgb,
     alpha_cutoff: int,
     scale: int,
+    upscale_filter: str,
     bg_dist: int,
     mask_blur: float,
     morph: int,
 ):
     """
-    Produce an opaque RGB image ready for vectorization:
+    Produce an opaque palette ("P") image ready for vectorization:
       1) Foreground mask = (alpha > alpha_cutoff) AND (color far enough from bg)
-         This works even if the PNG is fully opaque (alpha=255 everywhere).
+         This works even if the PNG is fully opaque (an RGB PNG skips the alpha test).
       2) Clean matte: blur -> threshold -> optional close (max then min)
       3) Foreground pixels snapped to nearest of {white_rgb, blue_rgb}
       4) Background set to bg_rgb key color
+    Palette order is [bg_rgb, white_rgb, blue_rgb].
     """
 
-    img = Image.open(in_png).convert("RGBA")
+    img = Image.open(in_png)
+    # Opaque RGB stays 3-channel: no alpha plane to add, resize, or gate on.
+    # A tRNS color key (img.info["transparency"]) is only applied by convert("RGBA").
+    if not (img.mode == "RGBA" or (img.mode == "RGB" and "transparency" not in img.info)):
+        img = img.convert("RGBA")
     if scale != 1:
-        img = img.resize((img.size[0]*scale, img.size[1]*scale), Image.Resampling.LANCZOS)
-
-    arr = np.array(img, dtype=np.uint8)
-    rgb = arr[..., :3].astype(np.int32)   # int32 avoids overflow
-    a   = arr[..., 3].astype(np.int32)
+        # Pixels get hard-snapped to a 3-color palette below, so LANCZOS's wide kernel buys
+        # nothing over BILINEAR. NEAREST is cheapest but leaves scale-sized stairs on edges.
+        resample = Image.Resampling[upscale_filter.upper()]
+        img = img.resize((img.size[0]*scale, img.size[1]*scale), resample)
 
-    bg = np.array(bg_rgb, dtype=np.int32)
-    diff = rgb - bg
-    dist2 = (diff[..., 0]*diff[..., 0] + diff[..., 1]*diff[..., 1] + diff[..., 2]*diff[..., 2])
+    arr = np.asarray(img, dtype=np.uint8)   # read-only view; the kernels never write to it
+    bg = np.array(bg_rgb, dtype=np.int64)
 
-    fg_alpha = a > int(alpha_cutoff)
-    fg_key   = dist2 > int(bg_dist*bg_dist)
+    kernels = _jit_kernels() if arr.shape[0]*arr.shape[1] >= NUMBA_MIN_PIXELS else None
+    key_mask, snap_to_palette = kernels or (_key_mask_np, _snap_to_palette_np)
 
-    fg = fg_alpha & fg_key
+    fg = key_mask(arr, bg, int(alpha_cutoff), int(bg_dist))
 
     # --- matte cleanup: blur -> threshold -> optional close ---
-    mask = Image.fromarray((fg.astype(np.uint8) * 255), mode="L")
+    # bool -> 0/255 in one pass; the mask then moves between Pillow and NumPy as views
+    mask = Image.fromarray(fg.view(np.uint8) * 255, mode="L")
 
     if mask_blur and mask_blur > 0:
         mask = mask.filter(ImageFilter.GaussianBlur(radius=float(mask_blur)))
@@ -157,34 +279,46 @@ def preprocess_flat_keyed_rgb(
 
     # Close to remove tiny gaps / single-pixel jaggies (3 or 5 typical)
     if morph and morph >= 3:
-        mask = mask.filter(ImageFilter.MaxFilter(size=int(morph))).filter(
-            ImageFilter.MinFilter(size=int(morph))
-        )
+        ndimage = _ndimage() if mask.size[0]*mask.size[1] >= SCIPY_MIN_PIXELS else None
+        if ndimage is not None:
+            # Separable running max/min: O(morph) per pixel vs Pillow's O(morph^2) window.
+            # mode="nearest" replicates edges exactly like Pillow's rank filters.
+            m = ndimage.maximum_filter(np.asarray(mask), size=int(morph), mode="nearest")
+            m = ndimage.minimum_filter(m, size=int(morph), mode="nearest")
+        else:
+            m = np.asarray(mask.filter(ImageFilter.MaxFilter(size=int(morph))).filter(
+                ImageFilter.MinFilter(size=int(morph))
+            ))
+    else:
+        m = np.asarray(mask)
 
-    fg = (np.array(mask, dtype=np.uint8) > 0)
+    fg = m > 0
 
     # --- classify to nearest palette color (robust on anti-aliased edges) ---
-    w = np.array(white_rgb, dtype=np.int32)
-    b = np.array(blue_rgb,  dtype=np.int32)
+    w = np.array(white_rgb, dtype=np.int64)
+    b = np.array(blue_rgb,  dtype=np.int64)
 
-    dw = ((rgb[..., 0]-w[0])**2 + (rgb[..., 1]-w[1])**2 + (rgb[..., 2]-w[2])**2)
-    db = ((rgb[..., 0]-b[0])**2 + (rgb[..., 1]-b[1])**2 + (rgb[..., 2]-b[2])**2)
+    # Nearest of two colors is a half-space test, so one dot product replaces two distances:
+    #   |p-b|^2 < |p-w|^2  <=>  2p.(w-b) < |w|^2 - |b|^2
+    idx = snap_to_palette(arr, fg, 2 * (w - b), int(w @ w - b @ b))
 
-    is_blue  = fg & (db < dw)
-    is_white = fg & ~is_blue
-
-    out = np.empty((arr.shape[0], arr.shape[1], 3), dtype=np.uint8)
-    out[:] = np.array(bg_rgb, dtype=np.uint8)
-    out[is_white] = np.array(white_rgb, dtype=np.uint8)
-    out[is_blue]  = np.array(blue_rgb,  dtype=np.uint8)
-
-    Image.fromarray(out, mode="RGB").save(out_png_rgb)
+    # Only three colors survive, so emit a palette image: 1 byte/pixel, ~5x smaller PNG
+    # to deflate. VTracer expands it back to the same colors.
+    out = Image.fromarray(idx, mode="P")
+    out.putpalette([*bg_rgb, *white_rgb, *blue_rgb])
+    return out
 
 def get_parser():
     ap = argparse.ArgumentParser()
-    ap.add_argument("input_png")
+    ap.add_argument("input_png", nargs="?", default=None)
     ap.add_argument("output_svg", nargs="?", default=None)
 
+    # Batch mode
+    ap.add_argument("--glob", default=None,
+                    help="Convert every file matching this (quoted) pattern to <name>.svg, instead of input_png.")
+    ap.add_argument("--jobs", type=int, default=None,
+                    help="Worker processes for --glob. Default: CPU count.")
+
     # Palette
     ap.add_argument("--white", default="FFFFFF", help="Waveform/pointer fill (default FFFFFF)")
     ap.add_argument("--blue",  default="276EE6", help="Cursor fill (default 276EE6)")
@@ -195,6 +329,9 @@ def get_parser():
                     help="Alpha <= cutoff becomes background. Default 140.")
     ap.add_argument("--scale", type=int, default=8,
                     help="Upscale before mask+trace. Default 8 (try 3 if still jaggy).")
+    ap.add_argument("--upscale-filter", default="bilinear",
+                    choices=["nearest", "box", "bilinear", "bicubic", "lanczos"],
+                    help="Resampling filter for the upscale. Default bilinear (lanczos for photographic input).")
 
     ap.add_argument("--bg-dist", type=int, default=35,
                     help="Background key distance in RGB units. Higher = tighter cut. Default 35.")
@@ -231,61 +368,116 @@ def generate_svg(args):
     blue_rgb  = parse_hex6(args.blue)
     bg_rgb    = parse_hex6(args.bghex)
 
-    with tempfile.TemporaryDirectory() as td:
-        keyed_rgb_png = os.path.join(td, "keyed_rgb.png")
-        raw_svg = os.path.join(td, "raw.svg")
-
-        preprocess_flat_keyed_rgb(
-            inp,
-            keyed_rgb_png,
-            white_rgb=white_rgb,
-            blue_rgb=blue_rgb,
-            bg_rgb=bg_rgb,
-            alpha_cutoff=args.alpha_cutoff,
-            scale=args.scale,
-            bg_dist=args.bg_dist,
-            mask_blur=args.mask_blur,
-            morph=args.morph,
-        )
-
-        if args.save_flat:
-            # save next to input or output if possible
-            out_target = args.output_svg if args.output_svg else (base_name + ".svg")
-            debug_flat = os.path.splitext(out_target)[0] + ".flat.png"
-            Image.open(keyed_rgb_png).save(debug_flat)
-            print(f"Wrote debug flat PNG: {debug_flat}", file=sys.stderr)
-
-        vtracer.convert_image_to_svg_py(
-            keyed_rgb_png, raw_svg,
-            colormode="color",
-            hierarchical=args.hierarchical,
-            mode=args.mode,
-            filter_speckle=args.filter_speckle,
-            corner_threshold=args.corner_threshold,
-            length_threshold=args.length_threshold,
-            max_iterations=args.max_iterations,
-            splice_threshold=args.splice_threshold,
-            path_precision=args.path_precision,
-            # Already forced palette, these matter less now:
-            color_precision=8,
-            layer_difference=64,
-        )
-
-        svg_text = open(raw_svg, "r", encoding="utf-8", errors="replace").read()
-        cleaned, removed, stripped = remove_key_color_from_svg(svg_text, bg_rgb, args.bg_tol)
-        
-        # We return the cleaned SVG string and some metadata stats
-        return cleaned, removed, stripped
+    flat = preprocess_flat_keyed_rgb(
+        inp,
+        white_rgb=white_rgb,
+        blue_rgb=blue_rgb,
+        bg_rgb=bg_rgb,
+        alpha_cutoff=args.alpha_cutoff,
+        scale=args.scale,
+        upscale_filter=args.upscale_filter,
+        bg_dist=args.bg_dist,
+        mask_blur=args.mask_blur,
+        morph=args.morph,
+    )
+
+    if args.save_flat:
+        # save next to input or output if possible
+        out_target = args.output_svg if args.output_svg else (base_name + ".svg")
+        debug_flat = os.path.splitext(out_target)[0] + ".flat.png"
+        flat.save(debug_flat)
+        print(f"Wrote debug flat PNG: {debug_flat}", file=sys.stderr)
+
+    # Hand VTracer an in-memory PNG instead of a temp file. Fast deflate keeps the encode
+    # cheap, and the flat 3-color image still compresses well enough to decode quickly.
+    buf = io.BytesIO()
+    flat.save(buf, format="PNG", compress_level=1)
+
+    svg_text = vtracer.convert_raw_image_to_svg(
+        buf.getvalue(),
+        img_format="png",
+        colormode="color",
+        hierarchical=args.hierarchical,
+        mode=args.mode,
+        filter_speckle=args.filter_speckle,
+        corner_threshold=args.corner_threshold,
+        length_threshold=args.length_threshold,
+        max_iterations=args.max_iterations,
+        splice_threshold=args.splice_threshold,
+        path_precision=args.path_precision,
+        # Already forced palette, these matter less now:
+        color_precision=8,
+        layer_difference=64,
+    )
+
+    cleaned, removed, stripped = remove_key_color_from_svg(svg_text, bg_rgb, args.bg_tol)
+
+    # We return the cleaned SVG (utf-8 bytes) and some metadata stats
+    return cleaned, removed, stripped
+
+def _init_batch_worker():
+    # Files already run one per process: keep each worker's prange kernels on one
+    # thread, or the pool would start CPU-count x NUMBA_NUM_THREADS threads.
+    # numba reads the variable when first imported; a forked parent may already have it.
+    os.environ["NUMBA_NUM_THREADS"] = "1"
+    if "numba" in sys.modules:
+        sys.modules["numba"].set_num_threads(1)
+
+def generate_svgs(args, input_paths, workers=None):
+    """
+    Run generate_svg over several inputs in parallel worker processes.
+    Each input gets a copy of args with input_png/output_svg filled in;
+    yields (output_svg, cleaned, removed, stripped) in input order.
+    """
+    jobs = []
+    for inp in input_paths:
+        job = argparse.Namespace(**vars(args))
+        job.input_png = inp
+        job.output_svg = os.path.splitext(inp)[0] + ".svg"
+        jobs.append(job)
+
+    # Preprocess is single-core NumPy/Pillow and VTracer is single-core Rust, so files
+    # scale across processes.
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             initializer=_init_batch_worker) as ex:
+        for job, (cleaned, removed, stripped) in zip(jobs, ex.map(generate_svg, jobs)):
+            yield job.output_svg, cleaned, removed, stripped
+
+def batch_inputs(ap, args):
+    """Validate input_png vs --glob; return the sorted --glob matches, or None for one input."""
+    if args.jobs is not None:
+        if not args.glob:
+            ap.error("--jobs only applies with --glob")
+        if args.jobs < 1:
+            ap.error("--jobs must be at least 1")
+    if args.glob:
+        if args.input_png or args.output_svg:
+            ap.error("--glob replaces input_png/output_svg")
+        inputs = sorted(glob.glob(args.glob))
+        if not inputs:
+            ap.error(f"--glob matched no files: {args.glob}")
+        return inputs
+    if not args.input_png:
+        ap.error("input_png is required unless --glob is given")
+    return None
 
 def main():
     ap = get_parser()
     args = ap.parse_args()
+
+    inputs = batch_inputs(ap, args)
+    if inputs is not None:
+        for out, cleaned, removed, stripped in generate_svgs(args, inputs, args.jobs):
+            with open(out, "wb") as f:
+                f.write(cleaned)
+            print(f"Wrote: {out} (removed {removed} bg elems, stripped {stripped} bg strokes)")
+        return
     
     out = args.output_svg or (os.path.splitext(args.input_png)[0] + ".svg")
     
     cleaned, removed, stripped = generate_svg(args)
 
-    with open(out, "w", encoding="utf-8") as f:
+    with open(out, "wb") as f:
         f.write(cleaned)
 
     print(f"Wrote: {out} (removed {removed} bg elems, stripped {stripped} bg strokes)")
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import io
 import sys
 import os
 import subprocess
@@ -10,6 +11,59 @@ sys.path.insert(0, DIR)
 
 import svg
 
+try:
+    # Same optimizer core as the scour CLI, minus the process spawn and stdin/stdout copies
+    from scour import scour as scour_lib
+except ImportError:  # fall back to the scour executable on PATH
+    scour_lib = None
+
+def run_scour(cmd, raw_svg_content, out_file):
+    if scour_lib is not None:
+        # cmd[1:] are the CLI flags; parse_args validates them exactly like the executable
+        try:
+            options = scour_lib.parse_args(cmd[1:])
+        except SystemExit as e:  # usage error, already printed by scour's option parser
+            if e.code:
+                print("Error running scour.", file=sys.stderr)
+            sys.exit(e.code)
+
+        # -i/-o redirect the executable's input/output away from our pipe; let it handle them
+        if not (options.infilename or options.outfilename):
+            # Same stdin -> stdout setup as the CLI: stats/report go to stderr, and the
+            # "Scour processed" line honours -q/-v
+            infile = io.BytesIO(raw_svg_content)
+            infile.name = "<stdin>"
+            options.stdout = sys.stderr
+            try:
+                with open(out_file, "wb") as f:
+                    scour_lib.start(options, infile, f)
+            except Exception as e:
+                print(e, file=sys.stderr)
+                print("Error running scour.", file=sys.stderr)
+                sys.exit(1)
+            print(f"Wrote optimized SVG to: {out_file}", file=sys.stderr)
+            return
+
+    # We open the output file for writing
+    with open(out_file, "wb") as f:
+        # Run scour. A missing binary surfaces here rather than via a separate
+        # `scour --version` probe, which cost an extra interpreter spawn per run.
+        try:
+            res = subprocess.run(
+                cmd,
+                input=raw_svg_content,
+                stdout=f,
+            )
+        except FileNotFoundError:
+            print("Error: 'scour' not found on PATH (sudo apt install scour).", file=sys.stderr)
+            sys.exit(1)
+        
+    if res.returncode != 0:
+        print("Error running scour.", file=sys.stderr)
+        sys.exit(res.returncode)
+        
+    print(f"Wrote optimized SVG to: {out_file}", file=sys.stderr)
+
 def main():
     # 1. Parse arguments. We use svg.py's parser to identify known args.
     #    Everything else is assumed to be for 'scour'.
@@ -17,21 +71,30 @@ def main():
     
     # parse_known_args returns (known_args, unknown_args_list)
     args, scour_args = parser.parse_known_args()
-    
-    # Determine output file
-    # If not provided, svg.py defaults to replacing extension, but we need to know it
-    if args.output_svg:
-        out_file = args.output_svg
-    else:
-        out_file = os.path.splitext(args.input_png)[0] + ".svg"
-        # Update args to reflect this, so svg.generate_svg (if it used it) knows
-        args.output_svg = out_file
+
+    # --glob switches to batch mode: every match becomes <name>.svg
+    inputs = svg.batch_inputs(parser, args)
+
+    if inputs is None:
+        # Determine output file
+        # If not provided, svg.py defaults to replacing extension, but we need to know it
+        if args.output_svg:
+            out_file = args.output_svg
+        else:
+            out_file = os.path.splitext(args.input_png)[0] + ".svg"
+            # Update args to reflect this, so svg.generate_svg (if it used it) knows
+            args.output_svg = out_file
 
     # 2. Run svg.py generation
     try:
-        # returns (xml_string, removed_count, stripped_count)
-        raw_svg_content, removed, stripped = svg.generate_svg(args)
-        print(f"Generated SVG (removed {removed} bg elems, stripped {stripped} bg strokes)", file=sys.stderr)
+        if inputs is None:
+            # returns (xml_bytes, removed_count, stripped_count)
+            results = [(out_file, *svg.generate_svg(args))]
+        else:
+            # Converted in parallel worker processes, returned in input order
+            results = list(svg.generate_svgs(args, inputs, args.jobs))
+        for out_file, _, removed, stripped in results:
+            print(f"Generated SVG for {out_file} (removed {removed} bg elems, stripped {stripped} bg strokes)", file=sys.stderr)
     except Exception as e:
         print(f"Error generating SVG: {e}", file=sys.stderr)
         sys.exit(1)
@@ -53,38 +116,13 @@ def main():
     
     cmd = ["scour"] + default_scour_opts + scour_args
     
-    # 4. Run scour, piping raw_svg_content to stdin, and writing to out_file
-    print(f"Running scour: {' '.join(cmd)}", file=sys.stderr)
+    # 4. Run scour on each raw_svg_content (in-process when importable, else piped
+    #    to the executable's stdin), writing to its out_file
+    mode = "in-process" if scour_lib is not None else "subprocess"
+    print(f"Running scour ({mode}): {' '.join(cmd)}", file=sys.stderr)
     
-    try:
-        # check if scour is available
-        subprocess.run(["scour", "--version"], capture_output=True, check=True)
-    except (FileNotFoundError, subprocess.CalledProcessError):
-         # If system scour is missing, we might fail.
-         # The user said "use scour from apt install". 
-         # But wait, I installed 'scour' in the venv earlier too (via pip). 
-         # I should prefer the one in the path, which in this script (run by venv python) might be the venv one if activated?
-         # Actually subprocess.run searches PATH.
-         # If I want to be safe, I can check if 'scour' is in the venv bin?
-         # But the user specifically said "use scour from apt install". 
-         # So 'scour' command should be fine if it's in /usr/bin/scour.
-         pass
-
-    # We open the output file for writing
-    with open(out_file, "w", encoding="utf-8") as f:
-        # Run scour
-        res = subprocess.run(
-            cmd,
-            input=raw_svg_content,
-            stdout=f,
-            text=True
-        )
-        
-    if res.returncode != 0:
-        print("Error running scour.", file=sys.stderr)
-        sys.exit(res.returncode)
-        
-    print(f"Wrote optimized SVG to: {out_file}", file=sys.stderr)
+    for out_file, raw_svg_content, _, _ in results:
+        run_scour(cmd, raw_svg_content, out_file)
 
 if __name__ == "__main__":
     main()